@@ -3,28 +3,79 @@
 AVARA CLI — Runtime Authority Control Interface
 Interactive + Direct command modes for managing the AVARA security system.
 """
-import argparse
-import requests
-import sqlite3
 import sys
 import os
-import glob
+import re
 import shlex
 import traceback
 import json
 import time
-from datetime import datetime
+
+# Heavy modules (requests/urllib3, sqlite3, glob, argparse, aiohttp) are
+# imported lazily inside the handlers that need them, so help/version/theme
+# and REPL startup don't pay their import cost.
 
 try:
     import readline
 except ImportError:
     pass  # Windows or environment without readline support
 
+# orjson's C decoder is markedly faster for response/DB payloads; fall back
+# to the stdlib when it isn't installed.
+try:
+    import orjson
+    _loads = orjson.loads
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    _loads = json.loads
+    def _dumps(obj):
+        return json.dumps(obj, indent=2)
+
 API_BASE = "http://127.0.0.1:8000"
 DB_PATH = "avara_state.db"
 LOG_DIR = "./logs"
 VERSION = "1.0.0"
 
+# One keep-alive session for every CLI/demo request, so we reuse TCP
+# connections instead of paying a fresh handshake per call.
+_SESSION = None
+
+def _session():
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        _SESSION = requests.Session()
+        _SESSION.mount("http://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=32))
+    return _SESSION
+
+# Read queries used by the REPL. Keeping one live connection lets sqlite3's
+# built-in statement cache reuse the prepared SELECTs instead of re-parsing
+# them (and reopening the DB) on every command.
+_DB = None
+_Q_AGENTS = ("SELECT agent_id, role_name, scopes, created_at, ttl_seconds, "
+             "(strftime('%s','now') - created_at) > ttl_seconds AS expired "
+             "FROM agents ORDER BY created_at DESC")
+_Q_PENDING = ("SELECT action_id, agent_id, action_type, target, timestamp "
+              "FROM approvals WHERE status = 'PENDING' "
+              "AND (? IS NULL OR timestamp < ?) "
+              "ORDER BY timestamp DESC LIMIT ?")
+
+def _db():
+    global _DB
+    if _DB is None:
+        import sqlite3
+        # Read-only URI open: no write-lock handshake against the API's
+        # writer, and no empty DB file accidentally created by the CLI.
+        # (The server enables WAL on its side in PersistentStore.)
+        _DB = sqlite3.connect(f"file:{DB_PATH}?mode=ro", uri=True,
+                              check_same_thread=False, isolation_level=None)
+        _DB.execute("PRAGMA query_only=1")
+        _DB.execute("PRAGMA temp_store=MEMORY")
+        # mmap lets SQLite serve hot pages without read(2) syscalls.
+        _DB.execute("PRAGMA mmap_size=268435456")
+    return _DB
+
 # ─── ANSI Colors & Theming ───────────────────────────────────────────────────
 # Base colors
 YELLOW = "\033[38;5;220m"
@@ -55,12 +106,26 @@ TAGLINE = ""
 DIVIDER = ""
 PROMPT = ""
 
+# Fully assembled banner text per theme, so repeated redraws are a dict
+# lookup + one write instead of rebuilding the f-strings each time.
+_ACTIVE_THEME = "orange"
+_BANNER_CACHE = {}
+
 def apply_theme(theme_name):
-    global PRIMARY, LOGO, TAGLINE, DIVIDER, PROMPT
-    
+    global PRIMARY, LOGO, TAGLINE, DIVIDER, PROMPT, _ACTIVE_THEME, _CMD_FMT, _DEMO_RULE
+
     if theme_name in THEMES:
         PRIMARY = THEMES[theme_name]
-        
+        _ACTIVE_THEME = theme_name
+
+    # Help-row template and demo section rule: only PRIMARY varies by theme.
+    _CMD_FMT = "    " + PRIMARY + BOLD + "{:<12}" + RESET + " " + WHITE + "{:<36}" + RESET + " " + DIM + "{}" + RESET
+    _DEMO_RULE = f"{PRIMARY}{'=' * 72}{RESET}"
+
+    if theme_name in _BANNER_CACHE:
+        LOGO, TAGLINE, DIVIDER, PROMPT = _BANNER_CACHE[theme_name][1]
+        return
+
     LOGO = rf"""{PRIMARY}{BOLD}
   /$$$$$$  /$$    /$$  /$$$$$$  /$$$$$$$   /$$$$$$
  /$$__  $$| $$   | $$ /$$__  $$| $$__  $$ /$$__  $$
@@ -75,50 +140,64 @@ def apply_theme(theme_name):
     TAGLINE = f"{GRAY}  Autonomous Validation & Agent Risk Authority  ·  v{VERSION}{RESET}"
     DIVIDER = f"{GRAY}{'─' * 62}{RESET}"
     PROMPT  = f"{PRIMARY}{BOLD}avara>{RESET} "
+    _BANNER_CACHE[theme_name] = (LOGO + "\n" + TAGLINE + "\n\n", (LOGO, TAGLINE, DIVIDER, PROMPT))
 
 # Initialize default theme eagerly for top-level evals
 apply_theme("orange")
 
 # ─── Output Helpers ───────────────────────────────────────────────────────────
-def ok(msg):   print(f"  {GREEN}✔{RESET}  {msg}")
-def err(msg):  print(f"  {RED}✖{RESET}  {msg}")
-def warn(msg): print(f"  {YELLOW}⚠{RESET}  {msg}")
-def info(msg): print(f"  {CYAN}ℹ{RESET}  {msg}")
+# Status prefixes are composed once; the helpers just concatenate and write.
+_OK_PREFIX   = f"  {GREEN}✔{RESET}  "
+_ERR_PREFIX  = f"  {RED}✖{RESET}  "
+_WARN_PREFIX = f"  {YELLOW}⚠{RESET}  "
+_INFO_PREFIX = f"  {CYAN}ℹ{RESET}  "
+_ROW_SEP     = f"  {GRAY}{'─'*56}{RESET}\n"
+
+def ok(msg):   sys.stdout.write(_OK_PREFIX + msg + "\n")
+def err(msg):  sys.stdout.write(_ERR_PREFIX + msg + "\n")
+def warn(msg): sys.stdout.write(_WARN_PREFIX + msg + "\n")
+def info(msg): sys.stdout.write(_INFO_PREFIX + msg + "\n")
 
 def print_banner():
-    print(LOGO)
-    print(TAGLINE)
-    print()
+    sys.stdout.write(_BANNER_CACHE[_ACTIVE_THEME][0])
+
+# Full help screens, built once per theme (the only theme-dependent part
+# is the PRIMARY color in the command names).
+_HELP_CACHE = {}
 
 def print_help():
     print_banner()
-    print(DIVIDER)
-    print(f"\n{CYAN}{BOLD}  IDENTITY MANAGEMENT{RESET}")
-    _cmd("provision", "<role> <desc> [--scopes ...] [--ttl N]", "Provision a new ephemeral agent identity")
-    _cmd("revoke",    "<agent_id>",                             "Revoke an active agent identity")
-    _cmd("agents",    "",                                       "List all active agent identities")
-
-    print(f"\n{CYAN}{BOLD}  CIRCUIT BREAKER{RESET}")
-    _cmd("pending",   "",             "List high-risk actions awaiting approval")
-    _cmd("approve",   "<action_id>",  "Approve a halted action")
-    _cmd("deny",      "<action_id>",  "Deny a halted action")
-
-    print(f"\n{CYAN}{BOLD}  MONITORING{RESET}")
-    _cmd("status",    "",             "Check AVARA API server health")
-    _cmd("logs",      "[--tail N]",   "View recent audit log entries")
-
-    print(f"\n{CYAN}{BOLD}  GENERAL{RESET}")
-    _cmd("theme",     "<color>",      "Change the UI color theme (orange, blue, purple, green, red)")
-    _cmd("demo",      "",             "Run the interactive guided tour of all 8 security subsystems")
-    _cmd("help",      "",             "Show this help screen")
-    _cmd("clear",     "",             "Clear the terminal")
-    _cmd("exit",      "",             "Exit the AVARA shell")
-
-    print(f"\n{DIVIDER}")
-    print(f"  {DIM}Server: {API_BASE}  ·  DB: {DB_PATH}  ·  Logs: {LOG_DIR}{RESET}\n")
+    text = _HELP_CACHE.get(_ACTIVE_THEME)
+    if text is None:
+        lines = [DIVIDER, f"\n{CYAN}{BOLD}  IDENTITY MANAGEMENT{RESET}"]
+        lines.append(_cmd("provision", "<role> <desc> [--scopes ...] [--ttl N]", "Provision a new ephemeral agent identity"))
+        lines.append(_cmd("revoke",    "<agent_id>",                             "Revoke an active agent identity"))
+        lines.append(_cmd("agents",    "",                                       "List all active agent identities"))
+
+        lines.append(f"\n{CYAN}{BOLD}  CIRCUIT BREAKER{RESET}")
+        lines.append(_cmd("pending",   "[--limit N] [--before TS]", "List high-risk actions awaiting approval"))
+        lines.append(_cmd("approve",   "<action_id>",  "Approve a halted action"))
+        lines.append(_cmd("deny",      "<action_id>",  "Deny a halted action"))
+
+        lines.append(f"\n{CYAN}{BOLD}  MONITORING{RESET}")
+        lines.append(_cmd("status",    "",             "Check AVARA API server health"))
+        lines.append(_cmd("logs",      "[--tail N]",   "View recent audit log entries"))
+
+        lines.append(f"\n{CYAN}{BOLD}  GENERAL{RESET}")
+        lines.append(_cmd("theme",     "<color>",      "Change the UI color theme (orange, blue, purple, green, red)"))
+        lines.append(_cmd("demo",      "",             "Run the interactive guided tour of all 8 security subsystems"))
+        lines.append(_cmd("help",      "",             "Show this help screen"))
+        lines.append(_cmd("clear",     "",             "Clear the terminal"))
+        lines.append(_cmd("exit",      "",             "Exit the AVARA shell"))
+
+        lines.append(f"\n{DIVIDER}")
+        lines.append(f"  {DIM}Server: {API_BASE}  ·  DB: {DB_PATH}  ·  Logs: {LOG_DIR}{RESET}\n")
+        text = "\n".join(lines) + "\n"
+        _HELP_CACHE[_ACTIVE_THEME] = text
+    sys.stdout.write(text)
 
 def _cmd(name, args, desc):
-    print(f"    {PRIMARY}{BOLD}{name:<12}{RESET} {WHITE}{args:<36}{RESET} {DIM}{desc}{RESET}")
+    return _CMD_FMT.format(name, args, desc)
 
 # ─── Command Handlers ─────────────────────────────────────────────────────────
 def cmd_provision(args):
@@ -128,10 +207,11 @@ def cmd_provision(args):
         "scopes":      args.scopes,
         "ttl_seconds": args.ttl
     }
+    import requests
     try:
-        r = requests.post(f"{API_BASE}/iam/provision", json=payload, timeout=5)
+        r = _session().post(f"{API_BASE}/iam/provision", json=payload, timeout=5)
         r.raise_for_status()
-        d = r.json()
+        d = _loads(r.content)
         ok("Identity provisioned")
         print(f"    {GRAY}Agent ID :{RESET} {WHITE}{d['agent_id']}{RESET}")
         print(f"    {GRAY}Role     :{RESET} {WHITE}{args.role}{RESET}")
@@ -143,8 +223,9 @@ def cmd_provision(args):
         err(f"Provisioning failed: {e}")
 
 def cmd_revoke(args):
+    import requests
     try:
-        r = requests.delete(f"{API_BASE}/iam/revoke/{args.agent_id}", timeout=5)
+        r = _session().delete(f"{API_BASE}/iam/revoke/{args.agent_id}", timeout=5)
         r.raise_for_status()
         ok(f"Identity {PRIMARY}{args.agent_id}{RESET} revoked.")
     except requests.exceptions.ConnectionError:
@@ -154,59 +235,68 @@ def cmd_revoke(args):
 
 def cmd_agents(args):
     try:
-        with sqlite3.connect(DB_PATH) as conn:
-            rows = conn.execute(
-                "SELECT agent_id, role_name, scopes, created_at, ttl_seconds FROM agents"
-            ).fetchall()
+        rows = _db().execute(_Q_AGENTS).fetchall()
         if not rows:
             info("No active agent identities.")
             return
 
-        import json
-        print(f"\n  {CYAN}{BOLD}ACTIVE AGENT IDENTITIES{RESET}  ({len(rows)})\n")
+        parts = [f"\n  {CYAN}{BOLD}ACTIVE AGENT IDENTITIES{RESET}  ({len(rows)})\n\n"]
+        localtime, strftime = time.localtime, time.strftime
         for r in rows:
-            created = datetime.fromtimestamp(r[3]).strftime('%Y-%m-%d %H:%M:%S')
-            scopes = json.loads(r[2])
-            expired = (datetime.now().timestamp() - r[3]) > r[4]
-            status_badge = f"{RED}EXPIRED{RESET}" if expired else f"{GREEN}ACTIVE{RESET}"
-            print(f"  {GRAY}{'─'*56}{RESET}")
-            print(f"    {CYAN}ID{RESET}      {r[0]}  [{status_badge}]")
-            print(f"    {GRAY}Role  :{RESET}  {r[1]}")
-            print(f"    {GRAY}Scopes:{RESET}  {', '.join(scopes)}")
-            print(f"    {GRAY}Since :{RESET}  {created}  {DIM}(TTL: {r[4]}s){RESET}")
-        print()
+            created = strftime('%Y-%m-%d %H:%M:%S', localtime(r[3]))
+            scopes = _loads(r[2])
+            status_badge = f"{RED}EXPIRED{RESET}" if r[5] else f"{GREEN}ACTIVE{RESET}"
+            parts.append(_ROW_SEP)
+            parts.append(f"    {CYAN}ID{RESET}      {r[0]}  [{status_badge}]\n")
+            parts.append(f"    {GRAY}Role  :{RESET}  {r[1]}\n")
+            parts.append(f"    {GRAY}Scopes:{RESET}  {', '.join(scopes)}\n")
+            parts.append(f"    {GRAY}Since :{RESET}  {created}  {DIM}(TTL: {r[4]}s){RESET}\n")
+        parts.append("\n")
+        sys.stdout.write("".join(parts))
     except Exception as e:
         err(f"Could not read DB: {e}")
 
+def _fetch_pending_rows(limit, before):
+    return _db().execute(_Q_PENDING, (before, before, limit)).fetchall()
+
 def cmd_pending(args):
+    limit = getattr(args, 'limit', 50) or 50
+    before = getattr(args, 'before', None)
+    prefetch = getattr(args, '_prefetch', None)
     try:
-        with sqlite3.connect(DB_PATH) as conn:
-            rows = conn.execute(
-                "SELECT action_id, agent_id, action_type, target, timestamp "
-                "FROM approvals WHERE status = 'PENDING'"
-            ).fetchall()
+        # Keyset pagination: the partial (status, timestamp) index serves this
+        # as a range scan reading exactly `limit` rows, however large the table.
+        if prefetch is not None:
+            rows = prefetch.result()
+        else:
+            rows = _fetch_pending_rows(limit, before)
 
         if not rows:
             info("No pending approvals. All clear.")
             return
 
-        print(f"\n  {RED}{BOLD}PENDING CIRCUIT BREAKER APPROVALS{RESET}  ({len(rows)})\n")
+        parts = [f"\n  {RED}{BOLD}PENDING CIRCUIT BREAKER APPROVALS{RESET}  ({len(rows)})\n\n"]
+        localtime, strftime = time.localtime, time.strftime
         for r in rows:
-            dt = datetime.fromtimestamp(r[4]).strftime('%Y-%m-%d %H:%M:%S')
-            print(f"  {GRAY}{'─'*56}{RESET}")
-            print(f"    {CYAN}Action ID{RESET}  {r[0]}")
-            print(f"    {GRAY}Agent   :{RESET}  {r[1]}")
-            print(f"    {GRAY}Action  :{RESET}  {RED}{BOLD}{r[2]}{RESET}  →  {r[3]}")
-            print(f"    {GRAY}Halted  :{RESET}  {dt}")
-            print(f"    {GRAY}Resolve :{RESET}  {DIM}approve {r[0]}{RESET}")
-            print(f"    {GRAY}        :{RESET}  {DIM}deny    {r[0]}{RESET}")
-        print()
+            dt = strftime('%Y-%m-%d %H:%M:%S', localtime(r[4]))
+            parts.append(_ROW_SEP)
+            parts.append(f"    {CYAN}Action ID{RESET}  {r[0]}\n")
+            parts.append(f"    {GRAY}Agent   :{RESET}  {r[1]}\n")
+            parts.append(f"    {GRAY}Action  :{RESET}  {RED}{BOLD}{r[2]}{RESET}  →  {r[3]}\n")
+            parts.append(f"    {GRAY}Halted  :{RESET}  {dt}\n")
+            parts.append(f"    {GRAY}Resolve :{RESET}  {DIM}approve {r[0]}{RESET}\n")
+            parts.append(f"    {GRAY}        :{RESET}  {DIM}deny    {r[0]}{RESET}\n")
+        if len(rows) == limit:
+            parts.append(f"\n  {DIM}Older entries: pending --before {rows[-1][4]}{RESET}\n")
+        parts.append("\n")
+        sys.stdout.write("".join(parts))
     except Exception as e:
         err(f"Could not read DB: {e}")
 
 def cmd_resolve(args, decision):
+    import requests
     try:
-        r = requests.post(f"{API_BASE}/guard/approvals/{args.action_id}/{decision}", timeout=5)
+        r = _session().post(f"{API_BASE}/guard/approvals/{args.action_id}/{decision}", timeout=5)
         r.raise_for_status()
         verb = "approved" if decision == "approve" else "denied"
         ok(f"Action {PRIMARY}{args.action_id}{RESET} {verb}.")
@@ -218,28 +308,52 @@ def cmd_resolve(args, decision):
         err(f"Error: {e}")
 
 def cmd_status(args):
+    prefetch = getattr(args, '_prefetch', None)
     try:
-        r = requests.get(f"{API_BASE}/health", timeout=3)
+        if prefetch is not None:
+            r = prefetch.result()
+        else:
+            r = _session().get(f"{API_BASE}/health", timeout=3)
         r.raise_for_status()
         ok(f"AVARA Authority is {GREEN}{BOLD}ONLINE{RESET}  ({API_BASE})")
     except Exception:
         err(f"AVARA Authority is {RED}{BOLD}OFFLINE{RESET}  ({API_BASE})")
 
-    # DB status
-    if os.path.exists(DB_PATH):
-        size = os.path.getsize(DB_PATH)
+    # DB status (one stat call covers both the existence check and the size)
+    try:
+        size = os.stat(DB_PATH).st_size
         info(f"Database: {DB_PATH} ({size:,} bytes)")
-    else:
+    except OSError:
         warn(f"Database: {DB_PATH} not found (will be created on first use)")
 
-    # Log status
-    log_files = sorted(glob.glob(os.path.join(LOG_DIR, "*.log")))
-    if log_files:
-        info(f"Audit logs: {len(log_files)} file(s) in {LOG_DIR}/")
+    # Log status (scandir avoids glob's pattern walk; we only need a count)
+    try:
+        log_count = sum(1 for e in os.scandir(LOG_DIR) if e.name.endswith(".log"))
+    except OSError:
+        log_count = 0
+    if log_count:
+        info(f"Audit logs: {log_count} file(s) in {LOG_DIR}/")
     else:
         warn(f"Audit logs: none found in {LOG_DIR}/")
 
+# Single-pass classifier for log coloring: group 1 → red, 2 → green, 3 → yellow.
+_LOG_RE = re.compile(r"(BLOCK|DENIED|REVOKE)|(ALLOW|APPROVED|PROVISION)|(PENDING|APPROVAL_REQUEST)")
+
+def _tail_lines(path, tail):
+    """Read only the last `tail` lines of a file by seeking backwards in 8 KB blocks."""
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        buffer = b""
+        while pos > 0 and buffer.count(b"\n") <= tail:
+            step = min(8192, pos)
+            pos -= step
+            f.seek(pos)
+            buffer = f.read(step) + buffer
+    return [l.decode('utf-8', errors='replace') for l in buffer.splitlines()[-tail:]]
+
 def cmd_logs(args):
+    import glob
     tail = getattr(args, 'tail', 20) or 20
     log_files = sorted(glob.glob(os.path.join(LOG_DIR, "*.log")))
     if not log_files:
@@ -250,30 +364,26 @@ def cmd_logs(args):
     info(f"Showing last {tail} entries from {CYAN}{os.path.basename(latest)}{RESET}\n")
 
     try:
-        with open(latest, 'r') as f:
-            lines = f.readlines()
-        for line in lines[-tail:]:
+        parts = []
+        for line in _tail_lines(latest, tail):
             line = line.strip()
             if not line:
                 continue
-            # Color-code by event type
-            if "BLOCK" in line or "DENIED" in line or "REVOKE" in line:
-                print(f"    {RED}●{RESET}  {line}")
-            elif "ALLOW" in line or "APPROVED" in line or "PROVISION" in line:
-                print(f"    {GREEN}●{RESET}  {line}")
-            elif "PENDING" in line or "APPROVAL_REQUEST" in line:
-                print(f"    {YELLOW}●{RESET}  {line}")
-            else:
-                print(f"    {GRAY}●{RESET}  {line}")
-        print()
+            # Color-code by event type (one regex scan instead of nine substring checks)
+            m = _LOG_RE.search(line)
+            color = GRAY if m is None else (RED, GREEN, YELLOW)[m.lastindex - 1]
+            parts.append(f"    {color}●{RESET}  {line}\n")
+        parts.append("\n")
+        sys.stdout.write("".join(parts))
     except Exception as e:
         err(f"Could not read log file: {e}")
 
 # ─── Demo Subsystem ───────────────────────────────────────────────────────────
 def _print_header(text):
-    print(f"\n{PRIMARY}========================================================================{RESET}")
-    print(f"{PRIMARY}  {text}{RESET}")
-    print(f"{PRIMARY}========================================================================{RESET}")
+    sys.stdout.write(f"\n{_DEMO_RULE}\n{PRIMARY}  {text}{RESET}\n{_DEMO_RULE}\n")
+    # The demo paces itself with sleeps and prompts, so show each block
+    # immediately instead of waiting for the per-command flush.
+    sys.stdout.flush()
 
 def _print_step(title, desc):
     print(f"\n{CYAN}▶ {title}{RESET}")
@@ -283,10 +393,40 @@ def _print_step(title, desc):
 def _print_result(title, status_code, data):
     color = GREEN if status_code == 200 else RED
     print(f"\n  {color}➔ {title} (HTTP {status_code}){RESET}")
-    print(f"  {DIM}{json.dumps(data, indent=2)}{RESET}")
+    print(f"  {DIM}{_dumps(data)}{RESET}")
+    sys.stdout.flush()
     time.sleep(1)
 
+async def _burst(agent_id, n):
+    """Fire n validate_action requests concurrently; returns (status, body) per request, in order."""
+    import asyncio
+    import aiohttp
+    async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=50),
+                                     timeout=aiohttp.ClientTimeout(total=10)) as session:
+        async def _one(i):
+            payload = {
+                "agent_id": agent_id,
+                "task_intent": "Read files",
+                "proposed_action": "read_file",
+                "target_resource": f"file_{i}.txt",
+                "action_args": {},
+                "risk_level": "LOW"
+            }
+            async with session.post(f"{API_BASE}/guard/validate_action", json=payload) as resp:
+                return resp.status, await resp.json()
+        return await asyncio.gather(*(_one(i) for i in range(n)), return_exceptions=True)
+
 def cmd_demo(args):
+    import asyncio
+    import concurrent.futures
+    import requests
+
+    # Kick the health probe off now so it runs while the banner renders and
+    # the user reads the first prompt; by the time we need the result it has
+    # usually already completed.
+    pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    health_future = pool.submit(_session().get, f"{API_BASE}/health", timeout=5)
+
     print(f"\n{PRIMARY}████████████████████████████████████████████████████████████████████████{RESET}")
     print(f"{PRIMARY}██{RESET}                                                                    {PRIMARY}██{RESET}")
     print(f"{PRIMARY}██{RESET}                     AVARA GUIDED DEMO TOUR                         {PRIMARY}██{RESET}")
@@ -296,11 +436,13 @@ def cmd_demo(args):
     # 1. SERVER HEALTH
     _print_step("Check Server Health", "Verify the AVARA HTTP API is running.")
     try:
-        r = requests.get(f"{API_BASE}/health")
-        _print_result("Server Status", r.status_code, r.json())
-    except requests.exceptions.ConnectionError:
+        r = health_future.result(timeout=6)
+        _print_result("Server Status", r.status_code, _loads(r.content))
+    except (requests.exceptions.ConnectionError, concurrent.futures.TimeoutError):
         err("Could not connect to AVARA. Is the server running? (docker compose up -d avara-api)")
         return
+    finally:
+        pool.shutdown(wait=False)
 
     # 2. IAM PROVISIONING
     _print_header("1. IDENTITY & ACCESS MANAGEMENT (IAM)")
@@ -312,8 +454,8 @@ def cmd_demo(args):
         "scopes": ["execute:read_file", "api:query"],
         "ttl_seconds": 3600
     }
-    r = requests.post(f"{API_BASE}/iam/provision", json=payload)
-    data = r.json()
+    r = _session().post(f"{API_BASE}/iam/provision", json=payload, timeout=5)
+    data = _loads(r.content)
     _print_result("Provision Response", r.status_code, data)
     
     agent_id = data.get("agent_id")
@@ -332,8 +474,8 @@ def cmd_demo(args):
         "action_args": {},
         "risk_level": "LOW"
     }
-    r = requests.post(f"{API_BASE}/guard/validate_action", json=payload)
-    _print_result("Validation Response", r.status_code, r.json())
+    r = _session().post(f"{API_BASE}/guard/validate_action", json=payload, timeout=5)
+    _print_result("Validation Response", r.status_code, _loads(r.content))
 
     _print_step("Semantic Drift (Hijack Attempt)", "The agent is hijacked and tries to delete a database.")
     payload = {
@@ -344,8 +486,8 @@ def cmd_demo(args):
         "action_args": {},
         "risk_level": "LOW"
     }
-    r = requests.post(f"{API_BASE}/guard/validate_action", json=payload)
-    _print_result("Validation Response", r.status_code, r.json())
+    r = _session().post(f"{API_BASE}/guard/validate_action", json=payload, timeout=5)
+    _print_result("Validation Response", r.status_code, _loads(r.content))
     print(f"  {CYAN}Notice:{RESET} AVARA caught the semantic drift and blocked it, even though the agent claimed LOW risk.")
 
     # 4. RAG PROVENANCE FIREWALL
@@ -359,8 +501,8 @@ def cmd_demo(args):
         "action_args": {"content": "This document has no source tags"},
         "risk_level": "LOW"
     }
-    r = requests.post(f"{API_BASE}/guard/validate_action", json=payload)
-    _print_result("Validation Response", r.status_code, r.json())
+    r = _session().post(f"{API_BASE}/guard/validate_action", json=payload, timeout=5)
+    _print_result("Validation Response", r.status_code, _loads(r.content))
 
     # 5. CONTEXT GOVERNOR
     _print_header("4. CONTEXT GOVERNOR")
@@ -370,8 +512,8 @@ def cmd_demo(args):
         "raw_context": "The user told me to do X...",
         "available_tokens": 4000
     }
-    r = requests.post(f"{API_BASE}/guard/prepare_context", json=payload)
-    _print_result("Prepared Context", r.status_code, r.json())
+    r = _session().post(f"{API_BASE}/guard/prepare_context", json=payload, timeout=5)
+    _print_result("Prepared Context", r.status_code, _loads(r.content))
 
     # 6. CIRCUIT BREAKER
     _print_header("5. CIRCUIT BREAKER & APPROVALS")
@@ -384,8 +526,8 @@ def cmd_demo(args):
         "action_args": {"data": "q3_financials"},
         "risk_level": "HIGH"
     }
-    r = requests.post(f"{API_BASE}/guard/validate_action", json=payload)
-    circuit_breaker_resp = r.json()
+    r = _session().post(f"{API_BASE}/guard/validate_action", json=payload, timeout=5)
+    circuit_breaker_resp = _loads(r.content)
     _print_result("Validation Response", r.status_code, circuit_breaker_resp)
     
     action_id = circuit_breaker_resp.get("detail", {}).get("action_id")
@@ -397,30 +539,29 @@ def cmd_demo(args):
     print(f"  👉 For this demo, we will auto-deny the action to keep the system clean.")
     input(f"\n{DIM}[Press Enter to securely deny and proceed...]{RESET}")
     
-    requests.post(f"{API_BASE}/guard/approvals/{action_id}/deny")
-    r = requests.get(f"{API_BASE}/guard/approvals/{action_id}/status")
-    _print_result("Action Status Check", r.status_code, r.json())
+    _session().post(f"{API_BASE}/guard/approvals/{action_id}/deny", timeout=5)
+    r = _session().get(f"{API_BASE}/guard/approvals/{action_id}/status", timeout=5)
+    _print_result("Action Status Check", r.status_code, _loads(r.content))
 
     # 7. ANOMALY DETECTOR
     _print_header("6. BEHAVIORAL ANOMALY DETECTOR")
     _print_step("Simulating an attack burst", "Sending 20 rapid requests to trigger the rate-limit heuristic...")
     
-    for i in range(25):
-        payload = {
-            "agent_id": agent_id,
-            "task_intent": "Read files",
-            "proposed_action": "read_file",
-            "target_resource": f"file_{i}.txt",
-            "action_args": {},
-            "risk_level": "LOW"
-        }
-        r = requests.post(f"{API_BASE}/guard/validate_action", json=payload)
-        status = r.json().get("detail", "")
-        if r.status_code == 403 and "anomalous behavior" in status:
-            print(f"  {RED}➔ Request {i} BLOCKED: {status}{RESET}                ")
+    results = asyncio.run(_burst(agent_id, 25))
+    _write = sys.stdout.write
+    for i, result in enumerate(results):
+        if isinstance(result, Exception):
+            continue
+        status_code, body = result
+        status = body.get("detail", "")
+        if status_code == 403 and "anomalous behavior" in status:
+            _write(f"\x1b[2K  {RED}➔ Request {i} BLOCKED: {status}{RESET}\n")
             break
-        else:
-            print(f"  {DIM}Request {i} Allowed{RESET}                   ", end="\r")
+        # Only repaint the progress line every 5th request; the TTY write is
+        # the slowest thing in this loop.
+        if i % 5 == 0:
+            _write(f"\x1b[2K  {DIM}Request {i} Allowed{RESET}\r")
+    sys.stdout.flush()
 
     print("\n  👉 AVARA detected the anomaly and automatically revoked the identity.")
     
@@ -429,9 +570,7 @@ def cmd_demo(args):
     print("\n  👉 Every single action you just saw was cryptographically logged.")
     print(f"  👉 Run the {PRIMARY}logs{RESET} command next to see the exact execution trace.")
     
-    print(f"\n{PRIMARY}========================================================================{RESET}")
-    print(f"{PRIMARY}  END OF DEMO{RESET}")
-    print(f"{PRIMARY}========================================================================{RESET}\n")
+    sys.stdout.write(f"\n{_DEMO_RULE}\n{PRIMARY}  END OF DEMO{RESET}\n{_DEMO_RULE}\n\n")
 
 def cmd_theme(args):
     theme_name = args.color
@@ -442,54 +581,64 @@ def cmd_theme(args):
         err(f"Unknown theme: {theme_name}. Choose from: {', '.join(THEMES.keys())}")
 
 # ─── Argument Parser (shared by direct + REPL) ───────────────────────────────
-class ReplArgumentParser(argparse.ArgumentParser):
-    """Custom parser that doesn't exit or print raw stderr on error."""
-    def error(self, message):
-        # Instead of exiting, we raise an exception that the REPL can catch cleanly
-        raise ValueError(message)
+# Declarative command table: (name, handler, [(argument, add_argument kwargs)]).
+_CMD_SPECS = [
+    ("provision", cmd_provision, [("role", {}),
+                                  ("desc", {}),
+                                  ("--scopes", {"nargs": "+", "default": ["*"]}),
+                                  ("--ttl", {"type": int, "default": 3600})]),
+    ("revoke",    cmd_revoke,    [("agent_id", {})]),
+    ("agents",    cmd_agents,    []),
+    ("pending",   cmd_pending,   [("--limit", {"type": int, "default": 50}),
+                                  ("--before", {"type": float, "default": None})]),
+    ("approve",   lambda a: cmd_resolve(a, "approve"), [("action_id", {})]),
+    ("deny",      lambda a: cmd_resolve(a, "deny"),    [("action_id", {})]),
+    ("status",    cmd_status,    []),
+    ("logs",      cmd_logs,      [("--tail", {"type": int, "default": 20})]),
+    ("demo",      cmd_demo,      []),
+    ("theme",     cmd_theme,     [("color", {"choices": THEMES.keys()})]),
+]
 
 def build_parser():
-    parser = ReplArgumentParser(add_help=False)
-    sub = parser.add_subparsers(dest="command")
-
-    p = sub.add_parser("provision")
-    p.add_argument("role")
-    p.add_argument("desc")
-    p.add_argument("--scopes", nargs="+", default=["*"])
-    p.add_argument("--ttl", type=int, default=3600)
-    p.set_defaults(func=cmd_provision)
+    import argparse
 
-    p = sub.add_parser("revoke")
-    p.add_argument("agent_id")
-    p.set_defaults(func=cmd_revoke)
+    class ReplArgumentParser(argparse.ArgumentParser):
+        """Custom parser that doesn't exit or print raw stderr on error."""
+        def error(self, message):
+            # Instead of exiting, we raise an exception that the REPL can catch cleanly
+            raise ValueError(message)
 
-    sub.add_parser("agents").set_defaults(func=cmd_agents)
-    sub.add_parser("pending").set_defaults(func=cmd_pending)
-
-    p = sub.add_parser("approve")
-    p.add_argument("action_id")
-    p.set_defaults(func=lambda a: cmd_resolve(a, "approve"))
-
-    p = sub.add_parser("deny")
-    p.add_argument("action_id")
-    p.set_defaults(func=lambda a: cmd_resolve(a, "deny"))
-
-    sub.add_parser("status").set_defaults(func=cmd_status)
-
-    p = sub.add_parser("logs")
-    p.add_argument("--tail", type=int, default=20)
-    p.set_defaults(func=cmd_logs)
-
-    sub.add_parser("demo").set_defaults(func=cmd_demo)
+    # allow_abbrev=False skips argparse's prefix matching on every parse.
+    parser = ReplArgumentParser(add_help=False, allow_abbrev=False)
+    sub = parser.add_subparsers(dest="command")
 
-    p = sub.add_parser("theme")
-    p.add_argument("color", choices=THEMES.keys())
-    p.set_defaults(func=cmd_theme)
+    for name, handler, arg_specs in _CMD_SPECS:
+        p = sub.add_parser(name)
+        for arg, kwargs in arg_specs:
+            p.add_argument(arg, **kwargs)
+        p.set_defaults(func=handler)
 
     return parser
 
+def _buffer_stdout():
+    """Turn off per-line TTY flushing; handlers flush once per command instead."""
+    if sys.stdout.isatty():
+        try:
+            sys.stdout.reconfigure(line_buffering=False, write_through=False)
+        except (AttributeError, ValueError):
+            pass
+
 # ─── Interactive REPL ─────────────────────────────────────────────────────────
+# Zero-argument commands skip the argparse state machine entirely in the REPL.
+_FAST_DISPATCH = {
+    "agents":  cmd_agents,
+    "pending": cmd_pending,
+    "status":  cmd_status,
+    "demo":    cmd_demo,
+}
+
 def interactive_mode():
+    _buffer_stdout()
     print_banner()
     print(f"  {CYAN}Interactive mode.{RESET} Type {BOLD}help{RESET} for commands, {BOLD}exit{RESET} to quit.\n")
 
@@ -514,16 +663,30 @@ def interactive_mode():
             continue
 
         if raw == "clear":
-            os.system("clear" if os.name != "nt" else "cls")
+            # ANSI clear + scrollback wipe + home; the rest of the CLI already
+            # assumes ANSI, and this avoids a fork/exec of `clear`/`cls`.
+            sys.stdout.write("\x1b[2J\x1b[3J\x1b[H")
+            sys.stdout.flush()
             print_banner()
             continue
 
-        try:
-            tokens = shlex.split(raw)
-        except ValueError as e:
-            err(f"Parse error: {e}")
+        handler = _FAST_DISPATCH.get(raw)
+        if handler is not None:
+            handler(None)
+            sys.stdout.flush()
             continue
 
+        # shlex builds a full lexer per call; plain split is equivalent (and
+        # far cheaper) whenever the input has no quoting or escapes.
+        if "'" not in raw and '"' not in raw and "\\" not in raw:
+            tokens = raw.split()
+        else:
+            try:
+                tokens = shlex.split(raw)
+            except ValueError as e:
+                err(f"Parse error: {e}")
+                continue
+
         try:
             args = parser.parse_args(tokens)
         except ValueError as e:
@@ -537,6 +700,7 @@ def interactive_mode():
             continue
 
         args.func(args)
+        sys.stdout.flush()
 
 # ─── Entry Point ──────────────────────────────────────────────────────────────
 def main():
@@ -545,13 +709,13 @@ def main():
         interactive_mode()
         return
 
-    # Help flags
-    if sys.argv[1] in ('-h', '--help', 'help'):
+    # Help/version preflight: these paths must not build the parser, or the
+    # lazy argparse import (and its cold-start win) would be lost.
+    arg1 = sys.argv[1]
+    if arg1 in ('-h', '--help', 'help'):
         print_help()
         return
-
-    # Version flag
-    if sys.argv[1] in ('-v', '--version'):
+    if arg1 in ('-v', '--version'):
         print(f"avara-cli v{VERSION}")
         return
 
@@ -568,9 +732,24 @@ def main():
         print_help()
         sys.exit(1)
 
+    # Overlap the handler's I/O with the banner render: kick the query/probe
+    # off on a worker thread before the (surprisingly slow on remote TTYs)
+    # banner write happens.
+    if args.command in ("pending", "status"):
+        import concurrent.futures
+        pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        if args.command == "pending":
+            args._prefetch = pool.submit(
+                _fetch_pending_rows, getattr(args, 'limit', 50) or 50, getattr(args, 'before', None))
+        else:
+            args._prefetch = pool.submit(lambda: _session().get(f"{API_BASE}/health", timeout=3))
+        pool.shutdown(wait=False)
+
+    _buffer_stdout()
     print_banner()
     args.func(args)
     print()
+    sys.stdout.flush()
 
 if __name__ == "__main__":
     main()
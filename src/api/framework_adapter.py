@@ -1,6 +1,10 @@
 import requests
 from typing import Dict, Any, Optional
 
+# (connect, read) — a stalled control plane should surface as a failed
+# intercept quickly instead of hanging the framework's tool node.
+DEFAULT_TIMEOUT = (3.05, 10)
+
 class AVARAFrameworkAdapter:
     """
     Template middleware for integrating AVARA with any agent framework
@@ -9,11 +13,20 @@ class AVARAFrameworkAdapter:
     def __init__(self, agent_id: str, api_base_url: str = "http://127.0.0.1:8000"):
         self.agent_id = agent_id
         self.api_base_url = api_base_url
+        # One pooled session per adapter: every intercept reuses the same
+        # keep-alive socket to the control plane instead of re-handshaking.
+        self._session = requests.Session()
+        self._session.mount("http://", requests.adapters.HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=requests.adapters.Retry(total=2, backoff_factor=0.1),
+        ))
 
     def _post(self, endpoint: str, payload: dict) -> dict:
-        resp = requests.post(f"{self.api_base_url}{endpoint}", json=payload)
+        resp = self._session.post(f"{self.api_base_url}{endpoint}", json=payload,
+                                  timeout=DEFAULT_TIMEOUT)
         # Raise HTTP errors (e.g., 401 Unauthorized, 403 Forbidden)
-        resp.raise_for_status() 
+        resp.raise_for_status()
         return resp.json()
 
     def check_action_approval(self, task_intent: str, action: str, resource: str, args: dict, risk_level: str = "MEDIUM") -> bool:
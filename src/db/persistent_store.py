@@ -19,7 +19,12 @@ class PersistentStore:
     def _init_db(self):
         with sqlite3.connect(self.db_path) as conn:
             cursor = conn.cursor()
-            
+
+            # WAL so read-only clients (e.g. the CLI) never block behind our
+            # writes; the mode persists in the database file.
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+
             # Agent IAM Table
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS agents (
@@ -65,6 +70,18 @@ class PersistentStore:
                     timestamp REAL
                 )
             ''')
+            # PENDING rows are the rare case, so a partial index stays tiny
+            # while turning the CLI's pending-approvals scan into a lookup;
+            # including timestamp lets ordered/keyset reads walk the index.
+            cursor.execute('DROP INDEX IF EXISTS idx_approvals_status')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_approvals_status_pending
+                ON approvals(status, timestamp) WHERE status = 'PENDING'
+            ''')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_agents_created_at
+                ON agents(created_at)
+            ''')
             conn.commit()
 
     # --- IAM Persistence ---
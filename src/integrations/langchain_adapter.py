@@ -3,15 +3,102 @@ import requests
 import logging
 
 try:
-    from langchain_core.callbacks import BaseCallbackHandler
+    from langchain_core.callbacks import BaseCallbackHandler, AsyncCallbackHandler
     from langchain_core.agents import AgentAction
     from langchain_core.messages import BaseMessage
 except ImportError:
     logging.warning("Langchain is not installed. AVARALangChainCallback overrides will be inactive.")
     BaseCallbackHandler = object # Dummy base to prevent import error
+    AsyncCallbackHandler = object
     AgentAction = Any
     BaseMessage = Any
 
+try:
+    import httpx
+except ImportError:
+    httpx = None # Async adapter unavailable; the sync callback still works.
+
+# orjson's C codec keeps intercept-path (de)serialization off the stdlib's
+# pure-Python hot path; fall back silently when it isn't installed.
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    import json
+    _loads = json.loads
+    def _dumps(obj):
+        return json.dumps(obj).encode()
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# (connect, read) — a stalled control plane should fail the tool call fast
+# rather than hang the whole agent loop.
+DEFAULT_TIMEOUT = (3.05, 10)
+
+# Tools whose execution is inherently dangerous; hashed for O(1) membership
+# checks on every tool intercept.
+_HIGH_RISK_TOOLS = frozenset({"python_repl", "terminal", "bash", "requests"})
+
+def _tool_validation_payload(agent_id: str, task_intent: str, serialized: Dict[str, Any],
+                             input_str: str, kwargs: Dict[str, Any]):
+    """Build the validate_action payload shared by the sync and async callbacks."""
+    # Fail fast client-side: the server would reject an anonymous request
+    # anyway, so skip the round-trip entirely.
+    if not agent_id:
+        raise PermissionError("AVARA Authority Blocked Action: missing agent identity")
+
+    tool_name = serialized.get("name", "unknown_tool")
+
+    # We attempt to infer risk based on typical LangChain tools
+    # (e.g. bash or python repl are high risk, calculators are low risk)
+    risk_level = "HIGH" if tool_name.lower() in _HIGH_RISK_TOOLS else "MEDIUM"
+
+    args = kwargs.get("inputs", {})
+    if not args and input_str:
+        args = {"input": input_str}
+
+    # Fail closed on pathological tool inputs: substituting or trimming the
+    # args would let oversized payloads dodge the control plane's argument
+    # inspection, so refuse them outright.
+    if len(repr(args)) > 8192:
+        raise PermissionError(
+            "AVARA Authority Blocked Action: tool arguments exceed 8KB limit")
+
+    return tool_name, {
+        "agent_id": agent_id,
+        "task_intent": task_intent,
+        "proposed_action": tool_name,
+        "target_resource": "langchain_tool",
+        "action_args": args,
+        "risk_level": risk_level
+    }
+
+def _context_payload(agent_id: str, messages: List[List[BaseMessage]]) -> Optional[dict]:
+    """Build the prepare_context payload, or None when there is nothing to govern."""
+    if not messages or not messages[0]:
+        return None
+
+    flat_messages = messages[0]
+    # Very rough approximation for MVP adapter: one pass picks up the first
+    # system message and the last human turn.
+    system_content = user_content = ""
+    for m in flat_messages:
+        t = m.type
+        if t == "system" and not system_content:
+            system_content = m.content
+        elif t == "human":
+            user_content = m.content
+
+    if not user_content:
+        return None
+
+    return {
+        "agent_id": agent_id,
+        "dynamic_query": user_content,
+        "system_prompt": system_content
+    }
+
 class AVARALangChainCallback(BaseCallbackHandler):
     """
     A LangChain Callback Handler that intercepts tool execution and LLM interactions
@@ -22,12 +109,21 @@ class AVARALangChainCallback(BaseCallbackHandler):
         self.task_intent = task_intent
         self.api_base_url = api_base_url
         self.logger = logging.getLogger(__name__)
+        # One pooled session per callback: every tool/LLM intercept reuses the
+        # same keep-alive socket to the control plane instead of re-handshaking.
+        self._session = requests.Session()
+        self._session.mount("http://", requests.adapters.HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=requests.adapters.Retry(total=2, backoff_factor=0.1),
+        ))
 
-    def _post_avara(self, endpoint: str, payload: dict) -> dict:
+    def _post_avara(self, endpoint: str, payload: dict, timeout=DEFAULT_TIMEOUT) -> dict:
         try:
-            resp = requests.post(f"{self.api_base_url}{endpoint}", json=payload)
+            resp = self._session.post(f"{self.api_base_url}{endpoint}", data=_dumps(payload),
+                                      headers=_JSON_HEADERS, timeout=timeout)
             resp.raise_for_status()
-            return resp.json()
+            return _loads(resp.content)
         except requests.exceptions.HTTPError as e:
             # Re-raise as a standard Exception so LangChain agent loop can catch/handle it
             # without obscure requests library knowledge.
@@ -37,25 +133,9 @@ class AVARALangChainCallback(BaseCallbackHandler):
         """
         Intercepts right before a LangChain tool executes.
         """
-        tool_name = serialized.get("name", "unknown_tool")
-        
-        # We attempt to infer risk based on typical LangChain tools 
-        # (e.g. bash or python repl are high risk, calculators are low risk)
-        risk_level = "HIGH" if tool_name.lower() in ["python_repl", "terminal", "bash", "requests"] else "MEDIUM"
-        
-        args = kwargs.get("inputs", {})
-        if not args and input_str:
-            args = {"input": input_str}
-
-        payload = {
-            "agent_id": self.agent_id,
-            "task_intent": self.task_intent,
-            "proposed_action": tool_name,
-            "target_resource": "langchain_tool",
-            "action_args": args,
-            "risk_level": risk_level
-        }
-        
+        tool_name, payload = _tool_validation_payload(
+            self.agent_id, self.task_intent, serialized, input_str, kwargs)
+
         self.logger.info(f"AVARA Intercept: Validating {tool_name} execution...")
         # Will raise PermissionError if AVARA blocks it, preventing execution.
         self._post_avara("/guard/validate_action", payload)
@@ -65,29 +145,65 @@ class AVARALangChainCallback(BaseCallbackHandler):
         """
         Intercepts before sending prompt to LLM to enforce Context Governor limits.
         """
-        if not messages or not messages[0]:
-            return
-            
-        flat_messages = messages[0]
-        # Very rough approximation for MVP adapter
-        system_content = next((m.content for m in flat_messages if m.type == "system"), "")
-        user_content = next((m.content for m in flat_messages if m.type == "human"), "")
-        
-        if not user_content:
+        payload = _context_payload(self.agent_id, messages)
+        if payload is None:
             return
-            
-        payload = {
-            "agent_id": self.agent_id,
-            "dynamic_query": user_content,
-            "system_prompt": system_content
-        }
-        
+
         self.logger.info(f"AVARA Intercept: Preparing constrained context...")
         # Will raise PermissionError if SATURATED
         res = self._post_avara("/guard/prepare_context", payload)
-        
-        # (Advanced behavior): In a real profound integration, we would mutate the `messages` list 
+
+        # (Advanced behavior): In a real profound integration, we would mutate the `messages` list
         # inline here to forcibly inject the Context Governor's `final_context_block`.
-        # However, Langchain's base callback doesn't support mutating inputs natively, 
+        # However, Langchain's base callback doesn't support mutating inputs natively,
         # it requires a custom wrapping chain. So we use this just for validation.
         self.logger.info(f"AVARA Intercept: Context Budget {res.get('budget_used')} Tokens.")
+
+class AVARAAsyncLangChainCallback(AsyncCallbackHandler):
+    """
+    Async variant of AVARALangChainCallback backed by httpx.AsyncClient, so
+    concurrent tool/LLM intercepts in an async agent loop share a pooled
+    connection instead of serializing behind blocking requests calls.
+    (The AVARA server speaks HTTP/1.1, so pooling/keep-alive is the win here
+    rather than HTTP/2 multiplexing.)
+    """
+    def __init__(self, agent_id: str, task_intent: str, api_base_url: str = "http://127.0.0.1:8000"):
+        if httpx is None:
+            raise ImportError("httpx is required for AVARAAsyncLangChainCallback")
+        self.agent_id = agent_id
+        self.task_intent = task_intent
+        self.api_base_url = api_base_url
+        self.logger = logging.getLogger(__name__)
+        self._client = httpx.AsyncClient(
+            base_url=api_base_url,
+            limits=httpx.Limits(max_keepalive_connections=20),
+            timeout=5.0,
+        )
+
+    async def _post_avara(self, endpoint: str, payload: dict) -> dict:
+        resp = await self._client.post(endpoint, content=_dumps(payload), headers=_JSON_HEADERS)
+        try:
+            resp.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            raise PermissionError(f"AVARA Authority Blocked Action: {e.response.text}")
+        return _loads(resp.content)
+
+    async def on_tool_start(self, serialized: Dict[str, Any], input_str: str, **kwargs: Any) -> Any:
+        tool_name, payload = _tool_validation_payload(
+            self.agent_id, self.task_intent, serialized, input_str, kwargs)
+
+        self.logger.info(f"AVARA Intercept: Validating {tool_name} execution...")
+        await self._post_avara("/guard/validate_action", payload)
+        self.logger.info(f"AVARA Intercept: Execution allowed.")
+
+    async def on_chat_model_start(self, serialized: Dict[str, Any], messages: List[List[BaseMessage]], **kwargs: Any) -> Any:
+        payload = _context_payload(self.agent_id, messages)
+        if payload is None:
+            return
+
+        self.logger.info(f"AVARA Intercept: Preparing constrained context...")
+        res = await self._post_avara("/guard/prepare_context", payload)
+        self.logger.info(f"AVARA Intercept: Context Budget {res.get('budget_used')} Tokens.")
+
+    async def aclose(self):
+        await self._client.aclose()